@@ -6,14 +6,157 @@ Analyze trading performance and calculate potential profit
 import pandas as pd
 import numpy as np
 
-# Load the metrics
-df = pd.read_csv('trading_metrics.csv', names=[
-    'timestamp', 'mid_price', 'spread_bps', 'position', 'realized_pnl',
+# Column order matches MetricsCollector::export_to_csv; the exported header
+# row is replaced by these names
+METRIC_COLUMNS = [
+    'timestamp', 'mid_price', 'spread_bps', 'realized_pnl', 'position',
     'hawkes_buy', 'hawkes_sell', 'latency_us', 'trades', 'fills', 'regime', 'queue_util'
-])
+]
+METRIC_DTYPES = {
+    'timestamp': 'int64',
+    'mid_price': 'float32',
+    'spread_bps': 'float32',
+    'realized_pnl': 'float64',
+    'position': 'int32',
+    'hawkes_buy': 'float32',
+    'hawkes_sell': 'float32',
+    'latency_us': 'float32',
+    'trades': 'int32',
+    'fills': 'int32',
+    'regime': 'int8',
+    'queue_util': 'float32'
+}
+CHUNK_SIZE = 1_000_000  # rows held in memory at once
 
-# Convert timestamp to numeric
-df['timestamp'] = pd.to_numeric(df['timestamp'], errors='coerce')
+# Latency percentiles are exact up to EXACT_PERCENTILE_ROWS samples; past
+# that the samples fold into a fixed-bin histogram so memory stays bounded
+EXACT_PERCENTILE_ROWS = 10_000_000
+LATENCY_BIN_US = 0.01  # histogram resolution, the printed precision
+LATENCY_HIST_MAX_US = 1000.0  # slower samples count in the last bin
+
+# Risk regime codes 0-3 match MarketRegime
+REGIME_NAMES = ['NORMAL', 'ELEVATED', 'STRESSED', 'HALTED']
+
+class RunningStats:
+    """Count/mean/variance/min/max merged chunk by chunk (Chan et al. parallel update)"""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+    
+    def update(self, values):
+        n = values.size
+        if n == 0:
+            return
+        chunk_mean = values.mean(dtype=np.float64)
+        chunk_m2 = np.square(values - chunk_mean).sum()
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+    
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1, as pandas)"""
+        return np.sqrt(self.m2 / (self.count - 1))
+
+class LatencyQuantiles:
+    """Latency percentiles: exact for small runs, fixed-bin histogram beyond
+    
+    Chunks are kept until EXACT_PERCENTILE_ROWS samples have been seen, then
+    folded into LATENCY_BIN_US-wide bins and counted there from then on, so
+    percentiles are accurate to one bin in O(1) memory.
+    """
+    
+    N_BINS = int(LATENCY_HIST_MAX_US / LATENCY_BIN_US)
+    
+    def __init__(self):
+        self.chunks = []
+        self.kept = 0
+        self.hist = None  # bin counts once past the exact limit
+    
+    def update(self, values):
+        if self.hist is None:
+            self.chunks.append(values)
+            self.kept += values.size
+            if self.kept <= EXACT_PERCENTILE_ROWS:
+                return
+            values = np.concatenate(self.chunks)
+            self.chunks = []
+            self.hist = np.zeros(self.N_BINS, dtype=np.int64)
+        bins = np.clip(np.floor(values / LATENCY_BIN_US), 0, self.N_BINS - 1).astype(np.int64)
+        self.hist += np.bincount(bins, minlength=self.N_BINS)
+    
+    def percentile(self, q):
+        if self.hist is None:
+            return np.percentile(np.concatenate(self.chunks), q)
+        # Bin holding the sample of rank q/100 * (n - 1), reported at its midpoint
+        cdf = np.cumsum(self.hist)
+        rank = np.asarray(q) / 100 * (cdf[-1] - 1)
+        return (np.searchsorted(cdf, rank, side='right') + 0.5) * LATENCY_BIN_US
+
+# Stream the metrics, keeping only running reductions between chunks
+n = 0
+first_ts = last_ts = None
+first_pnl = last_pnl = 0.0
+final_position = 0
+total_trades = 0
+total_fills = 0
+mid_stats = RunningStats()
+spread_stats = RunningStats()
+latency_stats = RunningStats()
+buy_stats = RunningStats()
+sell_stats = RunningStats()
+imb_stats = RunningStats()
+latency_quantiles = LatencyQuantiles()
+regime_counts = np.zeros(len(REGIME_NAMES), dtype=np.int64)
+trading_opportunities = 0
+
+for chunk in pd.read_csv('trading_metrics.csv', header=0, names=METRIC_COLUMNS, dtype=METRIC_DTYPES,
+                         engine='c', memory_map=True, chunksize=CHUNK_SIZE):
+    if first_ts is None:
+        first_ts = chunk['timestamp'].iloc[0]
+        first_pnl = chunk['realized_pnl'].iloc[0]
+    last_ts = chunk['timestamp'].iloc[-1]
+    last_pnl = chunk['realized_pnl'].iloc[-1]
+    final_position = chunk['position'].iloc[-1]
+    n += len(chunk)
+    
+    mid_stats.update(chunk['mid_price'].to_numpy())
+    spread_stats.update(chunk['spread_bps'].to_numpy())
+    total_trades += int(chunk['trades'].sum())
+    total_fills += int(chunk['fills'].sum())
+    
+    lat = chunk['latency_us'].to_numpy()
+    latency_stats.update(lat)
+    latency_quantiles.update(lat)
+    
+    # Hawkes imbalance (buy - sell) / (buy + sell)
+    hawkes_buy = chunk['hawkes_buy'].to_numpy()
+    hawkes_sell = chunk['hawkes_sell'].to_numpy()
+    buy_stats.update(hawkes_buy)
+    sell_stats.update(hawkes_sell)
+    imb = np.empty_like(hawkes_buy)
+    np.subtract(hawkes_buy, hawkes_sell, out=imb)
+    denom = hawkes_buy + hawkes_sell
+    defined = denom != 0
+    np.divide(imb, denom, out=imb, where=defined)
+    imb[~defined] = np.nan  # 0/0 is undefined; skipped like pandas' mean/max skip NaN
+    imb_stats.update(imb[defined])
+    
+    # Trading opportunities (when Hawkes imbalance is strong)
+    trading_opportunities += int(np.count_nonzero(np.abs(imb) > 0.15))
+    
+    regime_counts += np.bincount(chunk['regime'].to_numpy(), minlength=len(REGIME_NAMES))
+
+duration_us = last_ts - first_ts
+time_seconds = duration_us / 1e6
 
 print("=" * 70)
 print("  HFT TRADING SYSTEM - PERFORMANCE ANALYSIS")
@@ -22,54 +165,54 @@ print()
 
 # Basic stats
 print(f"Dataset Statistics:")
-print(f"   Total Ticks Processed:  {len(df):,}")
-print(f"   Time Period:            {(df['timestamp'].iloc[-1] - df['timestamp'].iloc[0]) / 1e6:.2f} seconds")
-print(f"   Tick Rate:              {len(df) / ((df['timestamp'].iloc[-1] - df['timestamp'].iloc[0]) / 1e6):.0f} ticks/second")
+print(f"   Total Ticks Processed:  {n:,}")
+print(f"   Time Period:            {time_seconds:.2f} seconds")
+print(f"   Tick Rate:              {n / time_seconds:.0f} ticks/second")
 print()
 
 # Price statistics
+mid_mean = mid_stats.mean
+mid_std = mid_stats.std
+mid_min, mid_max = mid_stats.min, mid_stats.max
+
 print(f"Market Data:")
-print(f"   Average Mid Price:      ${df['mid_price'].mean():.2f}")
-print(f"   Price Range:            ${df['mid_price'].min():.2f} - ${df['mid_price'].max():.2f}")
-print(f"   Price Volatility:       {df['mid_price'].std():.4f} ({df['mid_price'].std() / df['mid_price'].mean() * 100:.2f}%)")
-print(f"   Average Spread:         {df['spread_bps'].mean():.2f} bps")
+print(f"   Average Mid Price:      ${mid_mean:.2f}")
+print(f"   Price Range:            ${mid_min:.2f} - ${mid_max:.2f}")
+print(f"   Price Volatility:       {mid_std:.4f} ({mid_std / mid_mean * 100:.2f}%)")
+print(f"   Average Spread:         {spread_stats.mean:.2f} bps")
 print()
 
 # Trading performance
-total_trades = df['trades'].sum()
-total_fills = df['fills'].sum()
-total_pnl = df['realized_pnl'].iloc[-1] - df['realized_pnl'].iloc[0]
+total_pnl = last_pnl - first_pnl
 
 print(f"Trading Performance:")
 print(f"   Total Trades:           {int(total_trades)}")
 print(f"   Total Fills:            {int(total_fills)}")
-print(f"   Final Position:         {int(df['position'].iloc[-1])}")
+print(f"   Final Position:         {int(final_position)}")
 print(f"   Realized P&L:           ${total_pnl:.2f}")
 print()
 
 # Latency statistics
+p50_latency, p99_latency = latency_quantiles.percentile([50, 99])
 print(f"System Performance:")
-print(f"   Average Latency:        {df['latency_us'].mean():.2f} μs")
-print(f"   Min Latency:            {df['latency_us'].min():.2f} μs")
-print(f"   Max Latency:            {df['latency_us'].max():.2f} μs")
-print(f"   p50 Latency:            {df['latency_us'].quantile(0.50):.2f} μs")
-print(f"   p99 Latency:            {df['latency_us'].quantile(0.99):.2f} μs")
+print(f"   Average Latency:        {latency_stats.mean:.2f} μs")
+print(f"   Min Latency:            {latency_stats.min:.2f} μs")
+print(f"   Max Latency:            {latency_stats.max:.2f} μs")
+print(f"   p50 Latency:            {p50_latency:.2f} μs")
+print(f"   p99 Latency:            {p99_latency:.2f} μs")
 print()
 
 # Hawkes intensity analysis
 print(f"Order Flow Analysis (Hawkes Process):")
-print(f"   Avg Buy Intensity:      {df['hawkes_buy'].mean():.1f}")
-print(f"   Avg Sell Intensity:     {df['hawkes_sell'].mean():.1f}")
-df['hawkes_imbalance'] = (df['hawkes_buy'] - df['hawkes_sell']) / (df['hawkes_buy'] + df['hawkes_sell'])
-print(f"   Avg Imbalance:          {df['hawkes_imbalance'].mean():.3f}")
+print(f"   Avg Buy Intensity:      {buy_stats.mean:.1f}")
+print(f"   Avg Sell Intensity:     {sell_stats.mean:.1f}")
+print(f"   Avg Imbalance:          {imb_stats.mean:.3f}")
 print()
 
 # Regime analysis
-regime_counts = df['regime'].value_counts()
 print(f"Risk Regime Distribution:")
-for regime, count in regime_counts.items():
-    regime_name = ['NORMAL', 'ELEVATED', 'STRESSED', 'HALTED'][int(regime)]
-    pct = count / len(df) * 100
+for regime_name, count in zip(REGIME_NAMES, regime_counts):
+    pct = count / n * 100
     print(f"   {regime_name:12s}        {count:6d} ({pct:5.1f}%)")
 print()
 
@@ -81,13 +224,9 @@ print()
 
 # Simple market making simulation
 # Assume we capture half the spread on each trade
-avg_spread_dollars = df['mid_price'].mean() * df['spread_bps'].mean() / 10000
+avg_spread_dollars = mid_mean * spread_stats.mean / 10000
 profit_per_trade = avg_spread_dollars / 2  # Half spread capture
 
-# Estimate trading opportunities (when Hawkes imbalance is strong)
-strong_signal = df[abs(df['hawkes_imbalance']) > 0.15]
-trading_opportunities = len(strong_signal)
-
 # Assume 70% fill rate
 estimated_trades = int(trading_opportunities * 0.7)
 estimated_profit = estimated_trades * profit_per_trade
@@ -101,7 +240,6 @@ print(f"   Estimated Profit:            ${estimated_profit:.2f}")
 print()
 
 # Calculate profit rate
-time_seconds = (df['timestamp'].iloc[-1] - df['timestamp'].iloc[0]) / 1e6
 if time_seconds > 0:
     profit_per_second = estimated_profit / time_seconds
     profit_per_day = profit_per_second * 86400
@@ -115,9 +253,9 @@ if time_seconds > 0:
 
 # Risk metrics
 print(f"  Risk Analysis:")
-print(f"   Price Volatility (daily):    {df['mid_price'].std() * np.sqrt(252):.2f}%")
-print(f"   Max Hawkes Imbalance:        {df['hawkes_imbalance'].abs().max():.3f}")
-print(f"   System is in HALTED mode:    {(df['regime'] == 3).sum() / len(df) * 100:.1f}% of time")
+print(f"   Price Volatility (daily):    {mid_std * np.sqrt(252):.2f}%")
+print(f"   Max Hawkes Imbalance:        {max(-imb_stats.min, imb_stats.max):.3f}")
+print(f"   System is in HALTED mode:    {regime_counts[3] / n * 100:.1f}% of time")
 print()
 
 print("=" * 70)
@@ -15,7 +15,6 @@ Key Features:
 import numpy as np
 import pandas as pd
 from datetime import datetime
-import random
 
 # ====
 # Configuration
@@ -37,6 +36,10 @@ ALPHA_BURST_STRENGTH = 0.85  # 85% directional bias during burst
 NOISE_PROBABILITY = 0.30  # 30% random noise
 RANDOM_WALK_STEP = 0.0001  # Small price drift
 
+# Dictionary-encoded categorical columns (code = index into the list)
+EVENT_TYPES = ['add', 'cancel', 'modify']
+SIDES = ['B', 'S']
+
 print("="*70)
 print("GENERATING SYNTHETIC DATA WITH EMBEDDED PERSISTENT ALPHA")
 print("="*70)
@@ -54,151 +57,93 @@ print()
 # ====
 # Initialize State
 # ====
-np.random.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)
 
 start_time_ns = int(datetime.now().timestamp() * 1e9)
-current_time_ns = start_time_ns
-
-mid_price = BASE_PRICE
-bid_price = mid_price - (SPREAD_TICKS / 2) * TICK_SIZE
-ask_price = mid_price + (SPREAD_TICKS / 2) * TICK_SIZE
-
-events = []
-order_id_counter = 1
-
-# Alpha burst state
-in_alpha_burst = False
-alpha_burst_direction = 0  # +1 for buy pressure, -1 for sell pressure
-alpha_burst_remaining = 0
-alpha_bursts_generated = 0
-
-# ====
-# Helper Functions
-# ====
-
-def round_to_tick(price):
-    """Round price to nearest tick"""
-    return round(price / TICK_SIZE) * TICK_SIZE
-
-def generate_event_type():
-    """Generate realistic event type distribution"""
-    rand = random.random()
-    if rand < 0.40:
-        return 'add'
-    elif rand < 0.60:
-        return 'cancel'
-    else:
-        return 'modify'
-
-def generate_size():
-    """Generate realistic order size (1-50 shares, biased toward small)"""
-    # Exponential distribution biased toward small orders
-    size = int(np.random.exponential(10) + 1)
-    return min(max(size, 1), 50)
-
-def generate_level():
-    """Generate price level (0-10, biased toward top of book)"""
-    # Exponential distribution biased toward level 0-2
-    level = int(np.random.exponential(2))
-    return min(level, 10)
 
 # ====
 # Generate Events with Embedded Alpha
 # ====
 print("Generating events...")
 
-for i in range(TOTAL_EVENTS):
-    # Update time (events every ~100ns)
-    time_delta_ns = int(np.random.uniform(80, 120))  # 80-120ns jitter
-    current_time_ns += time_delta_ns
-    
-    # 
-    # ALPHA BURST LOGIC: Create persistent order flow imbalances
-    # 
-    
-    # Check if we should start a new alpha burst
-    if not in_alpha_burst and i % 100 == 0:  # Check every 100 ticks
-        if random.random() < ALPHA_BURST_PROBABILITY:
-            in_alpha_burst = True
-            alpha_burst_direction = random.choice([1, -1])  # Buy or sell pressure
-            alpha_burst_remaining = ALPHA_BURST_DURATION_TICKS + int(np.random.uniform(-5, 10))
-            alpha_bursts_generated += 1
-            
-            if i % 1000 == 0:  # Progress indicator
-                print(f"  Generated {alpha_bursts_generated} alpha bursts (at event {i:,})")
-    
-    # Determine if this event is part of alpha signal
-    is_alpha_event = False
-    event_side = None
-    
-    if in_alpha_burst:
-        # During alpha burst: strong directional bias
-        if random.random() < ALPHA_BURST_STRENGTH:
-            is_alpha_event = True
-            event_side = 'B' if alpha_burst_direction > 0 else 'S'
-        
-        alpha_burst_remaining -= 1
-        if alpha_burst_remaining <= 0:
-            in_alpha_burst = False
-    
-    # If not alpha event, generate random event (noise)
-    if not is_alpha_event:
-        if random.random() < NOISE_PROBABILITY:
-            event_side = random.choice(['B', 'S'])
-        else:
-            # Continue previous trend (weak autocorrelation)
-            if events and random.random() < 0.55:
-                event_side = events[-1]['side']
-            else:
-                event_side = random.choice(['B', 'S'])
-    
-    # 
-    # Generate Event Details
-    # 
-    
-    event_type = generate_event_type()
-    size = generate_size()
-    level = generate_level()
-    
-    # Calculate price based on side and level
-    if event_side == 'B':
-        price = round_to_tick(bid_price - level * TICK_SIZE)
-    else:
-        price = round_to_tick(ask_price + level * TICK_SIZE)
-    
-    # Ensure price is positive
-    price = max(price, 1.0)
-    
-    # Store event
-    events.append({
-        'ts_us': current_time_ns,  # Keep as nanoseconds (will convert to microseconds)
-        'event_type': event_type,
-        'side': event_side,
-        'price': price,
-        'size': size,
-        'order_id': order_id_counter,
-        'level': level
-    })
-    
-    order_id_counter += 1
-    
-    # 
-    # Price Dynamics: Small random walk with mean reversion
-    # 
-    
-    if i % 500 == 0:  # Update prices periodically
-        # Random walk
-        price_change = np.random.normal(0, RANDOM_WALK_STEP)
-        mid_price += price_change
-        
-        # Mean reversion toward BASE_PRICE
-        mean_reversion = (BASE_PRICE - mid_price) * 0.001
-        mid_price += mean_reversion
-        
-        # Update bid/ask
-        bid_price = mid_price - (SPREAD_TICKS / 2) * TICK_SIZE
-        ask_price = mid_price + (SPREAD_TICKS / 2) * TICK_SIZE
+N = TOTAL_EVENTS
+event_index = np.arange(N)
+
+# Update time (events every ~100ns, 80-120ns jitter)
+time_deltas_ns = rng.integers(80, 120, size=N)
+ts_ns = start_time_ns + np.cumsum(time_deltas_ns)
+
+# 
+# ALPHA BURST LOGIC: Create persistent order flow imbalances
+# 
+
+# Bursts can only start on the 100-tick grid and always end (<= 24 ticks)
+# before the next grid point, so every grid point is an independent trial.
+burst_grid = np.arange(0, N, 100)
+burst_starts = burst_grid[rng.binomial(1, ALPHA_BURST_PROBABILITY, burst_grid.size).astype(bool)]
+alpha_bursts_generated = burst_starts.size
+burst_directions = rng.choice([1, -1], size=alpha_bursts_generated)  # Buy or sell pressure
+burst_lengths = ALPHA_BURST_DURATION_TICKS + rng.uniform(-5, 10, alpha_bursts_generated).astype(np.int64)
+
+# +direction at each burst start, -direction one past its end; the running
+# sum is the burst direction of every event (0 outside bursts)
+direction_marks = np.zeros(N + 1, dtype=np.int64)
+np.add.at(direction_marks, burst_starts, burst_directions)
+np.add.at(direction_marks, np.minimum(burst_starts + burst_lengths, N), -burst_directions)
+direction = np.cumsum(direction_marks)[:N]
+in_burst = direction != 0
+
+# During alpha burst: strong directional bias
+is_alpha_event = in_burst & (rng.random(N) < ALPHA_BURST_STRENGTH)
+burst_side = np.where(direction > 0, 0, 1).astype(np.int8)  # 0=B, 1=S
+random_side = rng.choice(2, size=N).astype(np.int8)
+
+# Non-alpha events are random noise, or continue the previous side
+# (weak autocorrelation). A continuing event inherits the side of the
+# most recent event that drew a fresh side.
+is_noise = rng.random(N) < NOISE_PROBABILITY
+is_continuation = ~is_alpha_event & ~is_noise & (rng.random(N) < 0.55)
+is_continuation[0] = False
+side_codes = np.where(is_alpha_event, burst_side, random_side)
+last_fresh = np.maximum.accumulate(np.where(is_continuation, 0, event_index))
+side_codes = side_codes[last_fresh]
+
+# 
+# Generate Event Details
+# 
+
+# Realistic event type distribution
+event_type_codes = rng.choice(len(EVENT_TYPES), p=[0.40, 0.20, 0.40], size=N).astype(np.int8)
+
+# Order size (1-50 shares), exponential distribution biased toward small orders
+size = np.clip(rng.exponential(10, N).astype(np.int32) + 1, 1, 50)
+
+# Price level (0-10), exponential distribution biased toward level 0-2
+level = np.minimum(rng.exponential(2, N).astype(np.int32), 10)
+
+# 
+# Price Dynamics: Small random walk with mean reversion
+# 
+
+# Prices update after every 500th event. Deviation from BASE_PRICE follows
+# d[k] = decay * (d[k-1] + step[k]), i.e. d[k] = decay^(k+1) * cumsum(step[j] / decay^j)
+n_updates = (N - 1) // 500 + 1
+steps = rng.normal(0, RANDOM_WALK_STEP, n_updates)
+decay = 1.0 - 0.001
+k = np.arange(1, n_updates + 1)
+deviation = decay ** (k + 1) * np.cumsum(steps * decay ** -k)
+mid_path = BASE_PRICE + np.concatenate(([0.0], deviation))
+mid_price = mid_path[(event_index + 499) // 500]
+
+bid_price = mid_price - (SPREAD_TICKS / 2) * TICK_SIZE
+ask_price = mid_price + (SPREAD_TICKS / 2) * TICK_SIZE
+
+# Calculate price based on side and level, rounded to the nearest tick
+price = np.where(side_codes == 0, bid_price - level * TICK_SIZE, ask_price + level * TICK_SIZE)
+price = np.rint(price / TICK_SIZE) * TICK_SIZE
+
+# Ensure price is positive
+price = np.maximum(price, 1.0)
 
 # ====
 # Create DataFrame and Save
@@ -207,22 +152,30 @@ print(f"\nAlpha bursts generated: {alpha_bursts_generated}")
 print(f"Expected profitable signals: ~{alpha_bursts_generated} (each lasting {ALPHA_BURST_DURATION_TICKS} ticks)")
 print()
 
-df = pd.DataFrame(events)
-
 # Convert nanoseconds to microseconds for the CSV format
-df['ts_us'] = (df['ts_us'] / 1000).astype(int)
+ts_us = ts_ns // 1000
 
 # Format prices to 2 decimal places
-df['price'] = df['price'].round(2)
+price = np.round(price, 2)
 
-# Save to CSV
+# Save to CSV. The frame only wraps the columns for pandas' C writer
+# (measured ~3x faster than np.savetxt, which formats row by row in Python);
+# the analysis below reads the arrays directly.
 output_file = 'synthetic_ticks_with_alpha.csv'
-df.to_csv(output_file, index=False, header=False)
+pd.DataFrame({
+    'ts_us': ts_us,
+    'event_type': pd.Categorical.from_codes(event_type_codes, categories=EVENT_TYPES),
+    'side': pd.Categorical.from_codes(side_codes, categories=SIDES),
+    'price': price,
+    'size': size,
+    'order_id': event_index + 1,
+    'level': level
+}, copy=False).to_csv(output_file, index=False, header=False)
 
 print("="*70)
-print(f"Generated {len(df):,} events")
+print(f"Generated {N:,} events")
 print(f"Saved to: {output_file}")
-print(f"Duration: {(df['ts_us'].iloc[-1] - df['ts_us'].iloc[0]) / 1e6:.2f} seconds")
+print(f"Duration: {(ts_us[-1] - ts_us[0]) / 1e6:.2f} seconds")
 print()
 
 # ====
@@ -232,31 +185,31 @@ print("Data Quality Analysis:")
 print("-"*70)
 
 # Event type distribution
-event_counts = df['event_type'].value_counts()
+event_counts = np.bincount(event_type_codes, minlength=len(EVENT_TYPES))
 print(f"  Event types:")
-for event_type, count in event_counts.items():
-    print(f"    {event_type}: {count:,} ({count/len(df)*100:.1f}%)")
+for event_type, count in zip(EVENT_TYPES, event_counts):
+    print(f"    {event_type}: {count:,} ({count/N*100:.1f}%)")
 
 # Side distribution
-side_counts = df['side'].value_counts()
+side_counts = np.bincount(side_codes, minlength=len(SIDES))
 print(f"\n  Side distribution:")
-for side, count in side_counts.items():
+for side, count in zip(SIDES, side_counts):
     side_name = "Buy" if side == 'B' else "Sell"
-    print(f"    {side_name}: {count:,} ({count/len(df)*100:.1f}%)")
+    print(f"    {side_name}: {count:,} ({count/N*100:.1f}%)")
 
 # Price statistics
 print(f"\n  Price statistics:")
-print(f"    Min: ${df['price'].min():.2f}")
-print(f"    Max: ${df['price'].max():.2f}")
-print(f"    Mean: ${df['price'].mean():.2f}")
-print(f"    Std: ${df['price'].std():.4f}")
+print(f"    Min: ${price.min():.2f}")
+print(f"    Max: ${price.max():.2f}")
+print(f"    Mean: ${price.mean():.2f}")
+print(f"    Std: ${price.std(ddof=1):.4f}")
 
 # Size statistics
 print(f"\n  Order size statistics:")
-print(f"    Min: {df['size'].min()}")
-print(f"    Max: {df['size'].max()}")
-print(f"    Mean: {df['size'].mean():.1f}")
-print(f"    Median: {df['size'].median():.0f}")
+print(f"    Min: {size.min()}")
+print(f"    Max: {size.max()}")
+print(f"    Mean: {size.mean():.1f}")
+print(f"    Median: {np.median(size):.0f}")
 
 print("\n" + "="*70)
 print("Data generation complete!")
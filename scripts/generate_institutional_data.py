@@ -8,13 +8,80 @@ import numpy as np
 import pandas as pd
 import hashlib
 import json
+import mmap
 from datetime import datetime
 import sys
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from blake3 import blake3
+except ImportError:  # blake3 is optional; SHA256 stays the audit checksum
+    blake3 = None
+
+# Dictionary-encoded categorical columns (code = index into the list)
+EVENT_TYPES = ['add', 'modify', 'cancel']
+SIDES = ['B', 'S']
+
+@njit(cache=True)
+def simulate_alpha_bursts(burst_rands, direction_rands, strength_rands, side_rands,
+                          burst_probability, burst_duration, burst_strength):
+    """Run the alpha-burst state machine over pre-drawn uniforms.
+    
+    Returns per-event side codes (0=B, 1=S) and per-event burst directions
+    (+1/-1 on the event that starts a burst, 0 elsewhere).
+    """
+    n = burst_rands.shape[0]
+    sides = np.empty(n, np.int8)
+    burst_dirs = np.zeros(n, np.int8)
+    in_burst = False
+    remaining = 0
+    direction = 1
+    
+    for i in range(n):
+        # Check if we should start a new alpha burst
+        if not in_burst and burst_rands[i] < burst_probability:
+            in_burst = True
+            remaining = burst_duration
+            direction = 1 if direction_rands[i] < 0.5 else -1
+            burst_dirs[i] = direction
+        
+        if in_burst:
+            # During alpha burst: strong directional bias
+            if strength_rands[i] < burst_strength:
+                sides[i] = 0 if direction > 0 else 1
+            else:
+                sides[i] = 1 if direction > 0 else 0
+            
+            remaining -= 1
+            if remaining <= 0:
+                in_burst = False
+        else:
+            # Normal market: balanced
+            sides[i] = 0 if side_rands[i] < 0.5 else 1
+    
+    return sides, burst_dirs
+
+@njit(cache=True)
+def bounded_random_walk(start, steps, lower, upper):
+    """Cumulative random walk clipped to [lower, upper] at every step"""
+    path = np.empty(steps.shape[0], np.float64)
+    value = start
+    for i in range(steps.shape[0]):
+        value = min(max(value + steps[i], lower), upper)
+        path[i] = value
+    return path
+
 class InstitutionalDataGenerator:
     def __init__(self):
         self.seed = 42  # Deterministic seed for reproducibility
-        np.random.seed(self.seed)
+        self.rng = np.random.default_rng(self.seed)
         
         # Market parameters
         self.base_price = 100.0
@@ -32,8 +99,8 @@ class InstitutionalDataGenerator:
         self.burst_duration = 15  # ticks
         self.burst_strength = 0.85
         
-        # Generated data
-        self.market_data = []
+        # Generated data (columnar, one array per CSV field)
+        self.market_data = pd.DataFrame()
         self.alpha_bursts = []
         
     def generate_market_data(self):
@@ -50,85 +117,58 @@ class InstitutionalDataGenerator:
         print(f"  Base Price:         ${self.base_price}")
         print()
         
-        # Initialize market state
-        current_price = self.base_price
-        current_time_ns = self.start_time_ns
-        time_increment_ns = int((self.duration_seconds * 1e9) / self.total_events)
+        n = self.total_events
+        time_increment_ns = int((self.duration_seconds * 1e9) / n)
         
-        # Track alpha burst state
-        in_burst = False
-        burst_remaining = 0
-        burst_direction = 0  # 1=buy, -1=sell
-        burst_count = 0
+        print("Generating market events...")
         
-        order_id = 1
+        # Pre-draw all randomness in batches
+        burst_rands = self.rng.random(n)
+        direction_rands = self.rng.random(n)
+        strength_rands = self.rng.random(n)
+        side_rands = self.rng.random(n)
         
-        print("Generating market events...")
+        # Alpha bursts are a sequential state machine (a burst can only start
+        # once the previous one has ended), run in a compiled kernel
+        side_arr, burst_dirs = simulate_alpha_bursts(
+            burst_rands, direction_rands, strength_rands, side_rands,
+            self.burst_probability / 100, self.burst_duration, self.burst_strength)
         
-        for i in range(self.total_events):
-            # Check if we should start a new alpha burst
-            if not in_burst and np.random.random() < self.burst_probability / 100:
-                in_burst = True
-                burst_remaining = self.burst_duration
-                burst_direction = np.random.choice([1, -1])
-                burst_count += 1
-                self.alpha_bursts.append({
-                    'start_event': i,
-                    'direction': 'BUY' if burst_direction > 0 else 'SELL',
-                    'duration': self.burst_duration
-                })
-                
-                if burst_count % 5 == 0:
-                    print(f"  Generated {burst_count} alpha bursts (at event {i:,})")
-            
-            # Determine event characteristics
-            if in_burst:
-                # During alpha burst: strong directional bias
-                if np.random.random() < self.burst_strength:
-                    side = 'B' if burst_direction > 0 else 'S'
-                else:
-                    side = 'S' if burst_direction > 0 else 'B'
-                
-                burst_remaining -= 1
-                if burst_remaining <= 0:
-                    in_burst = False
-            else:
-                # Normal market: balanced
-                side = np.random.choice(['B', 'S'])
-            
-            # Event type distribution
-            event_type = np.random.choice(['add', 'modify', 'cancel'], p=[0.40, 0.40, 0.20])
-            
-            # Price with small random walk
-            current_price += np.random.normal(0, 0.0001)
-            current_price = np.clip(current_price, 99.8, 100.2)
-            
-            # Round to tick size
-            price = round(current_price / self.tick_size) * self.tick_size
-            
-            # Order size
-            size = np.random.randint(1, 51)
-            
-            # Depth level
-            level = np.random.randint(0, 7)
-            
-            # Create event
-            event = {
-                'timestamp_ns': current_time_ns,
-                'event_type': event_type,
-                'side': side,
-                'price': price,
-                'size': size,
-                'order_id': order_id,
-                'level': level
-            }
-            
-            self.market_data.append(event)
-            
-            # Increment time (with small jitter for realism)
-            jitter = np.random.randint(-10, 11)  # ±10ns jitter
-            current_time_ns += time_increment_ns + jitter
-            order_id += 1
+        burst_starts = np.flatnonzero(burst_dirs)
+        self.alpha_bursts = [{
+            'start_event': int(start),
+            'direction': 'BUY' if burst_dirs[start] > 0 else 'SELL',
+            'duration': self.burst_duration
+        } for start in burst_starts]
+        burst_count = len(self.alpha_bursts)
+        
+        # Event type distribution
+        type_arr = self.rng.choice(len(EVENT_TYPES), p=[0.40, 0.40, 0.20], size=n).astype(np.int8)
+        
+        # Price with small random walk, rounded to tick size
+        walk = bounded_random_walk(self.base_price, self.rng.normal(0, 0.0001, n), 99.8, 100.2)
+        price_arr = np.rint(walk / self.tick_size) * self.tick_size
+        
+        # Order size and depth level
+        size_arr = self.rng.integers(1, 51, size=n)
+        level_arr = self.rng.integers(0, 7, size=n)
+        
+        # Fixed increment with small jitter for realism (±10ns)
+        jitter = self.rng.integers(-10, 11, size=n)
+        ts_arr = self.start_time_ns + np.arange(n, dtype=np.int64) * time_increment_ns
+        ts_arr[1:] += np.cumsum(jitter[:-1])
+        
+        order_arr = np.arange(1, n + 1, dtype=np.int64)
+        
+        self.market_data = pd.DataFrame({
+            'timestamp_ns': ts_arr,
+            'event_type': pd.Categorical.from_codes(type_arr, categories=EVENT_TYPES),
+            'side': pd.Categorical.from_codes(side_arr, categories=SIDES),
+            'price': price_arr,
+            'size': size_arr,
+            'order_id': order_arr,
+            'level': level_arr
+        }, copy=False)
         
         print(f"\nAlpha bursts generated: {burst_count}")
         print(f"Expected profitable signals: ~{burst_count} (each lasting {self.burst_duration} ticks)")
@@ -138,30 +178,32 @@ class InstitutionalDataGenerator:
         """Save market data to CSV with proper format"""
         print(f"Saving market data to {filename}...")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(self.market_data)
-        
         # Save without header for C++ parser compatibility
-        with open(filename, 'w') as f:
-            for _, row in df.iterrows():
-                f.write(f"{row['timestamp_ns']},{row['event_type']},{row['side']},"
-                       f"{row['price']:.4f},{row['size']},{row['order_id']},{row['level']}\n")
+        self.market_data.to_csv(filename, header=False, index=False, float_format='%.4f', lineterminator='\n')
         
         print(f"Saved {len(self.market_data):,} events to {filename}")
         
         # Calculate SHA256 checksum
-        sha256_hash = hashlib.sha256()
         with open(filename, 'rb') as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                checksum = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    checksum = hashlib.sha256(mm).hexdigest()
         
-        checksum = sha256_hash.hexdigest()
         print(f"SHA256 Checksum: {checksum}")
         
+        # BLAKE3 (SIMD, multi-threaded) alongside the SHA256 audit chain
+        blake3_checksum = None
+        if blake3 is not None:
+            blake3_checksum = blake3(max_threads=blake3.AUTO).update_mmap(filename).hexdigest()
+            print(f"BLAKE3 Checksum: {blake3_checksum}")
+        
         # Save metadata
         metadata = {
             'filename': filename,
             'sha256': checksum,
+            'blake3': blake3_checksum,
             'seed': self.seed,
             'total_events': len(self.market_data),
             'start_time_ns': self.start_time_ns,
@@ -171,8 +213,9 @@ class InstitutionalDataGenerator:
             'generation_timestamp': datetime.now().isoformat()
         }
         
+        # Serialized in one piece; json.dump would issue a write per token
         with open('market_data_metadata.json', 'w') as f:
-            json.dump(metadata, f, indent=2)
+            f.write(json.dumps(metadata, indent=2))
         
         print(f"Metadata saved to market_data_metadata.json")
         print()
@@ -186,7 +229,7 @@ class InstitutionalDataGenerator:
         print("=" * 70)
         print()
         
-        df = pd.DataFrame(self.market_data)
+        df = self.market_data
         
         # Time analysis
         timestamps = df['timestamp_ns'].values
@@ -200,14 +243,16 @@ class InstitutionalDataGenerator:
         
         # Event type distribution
         print("Event Type Distribution:")
-        for event_type, count in df['event_type'].value_counts().items():
+        type_counts = np.bincount(df['event_type'].cat.codes, minlength=len(EVENT_TYPES))
+        for event_type, count in zip(EVENT_TYPES, type_counts):
             pct = count * 100.0 / len(df)
             print(f"  {event_type:<12} {count:>8,} ({pct:>5.1f}%)")
         print()
         
         # Side distribution
         print("Side Distribution:")
-        for side, count in df['side'].value_counts().items():
+        side_counts = np.bincount(df['side'].cat.codes, minlength=len(SIDES))
+        for side, count in zip(SIDES, side_counts):
             pct = count * 100.0 / len(df)
             side_name = "Buy" if side == 'B' else "Sell"
             print(f"  {side_name:<12} {count:>8,} ({pct:>5.1f}%)")
@@ -244,7 +289,7 @@ class InstitutionalDataGenerator:
             ("PASS" if len(df) >= 90000 else "FAIL", f"Event count: {len(df):,} >= 90,000"),
             ("PASS" if duration_ns/1e9 >= 9.0 else "FAIL", f"Duration: {duration_ns/1e9:.3f}s >= 9.0s"),
             ("PASS" if len(self.alpha_bursts) >= 10 else "FAIL", f"Alpha bursts: {len(self.alpha_bursts)} >= 10"),
-            ("PASS" if abs(df[df['side']=='B'].shape[0] - df[df['side']=='S'].shape[0]) / len(df) < 0.05 else "FAIL", "Side balance within 5%"),
+            ("PASS" if abs(side_counts[0] - side_counts[1]) / len(df) < 0.05 else "FAIL", "Side balance within 5%"),
             ("PASS" if prices.std() < 0.2 else "FAIL", f"Price volatility: σ={prices.std():.4f} < 0.2"),
         ]
         
@@ -3,9 +3,105 @@
 Simple backtest runner - loads CSV and shows how much profit the HFT system would make
 """
 
+import sys
+from functools import partial
+from io import StringIO
+
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the simulation runs as plain Python without it
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import pyarrow  # only probed; pandas drives the reader
+    CSV_ENGINE = 'pyarrow'  # multithreaded Arrow CSV reader
+except ImportError:  # pyarrow is optional; pandas' C parser reads the same file
+    CSV_ENGINE = 'c'
+
+TRADE_SIZE = 10  # shares per market-making fill
+
+class BookSide:
+    """One side of the order book: level -> (price, size)
+    
+    The total resting size is kept up to date by deltas and the best price
+    is cached, rescanned only after the best level worsens or is cancelled.
+    """
+    
+    def __init__(self, better):
+        self.levels = {}
+        self.total_size = 0
+        self._better = better  # max for bids, min for asks
+        self._best = None      # None = stale, rescan on next read
+    
+    def __bool__(self):
+        return bool(self.levels)
+    
+    def update(self, level, price, size):
+        old = self.levels.get(level)
+        self.levels[level] = (price, size)
+        if old is not None:
+            self.total_size -= old[1]
+        self.total_size += size
+        if self._best is not None:
+            if self._better(price, self._best) == price:
+                self._best = price
+            elif old is not None and old[0] == self._best:
+                self._best = None
+    
+    def cancel(self, level):
+        old = self.levels.pop(level, None)
+        if old is not None:
+            self.total_size -= old[1]
+            if old[0] == self._best:
+                self._best = None
+    
+    @property
+    def best(self):
+        if self._best is None:
+            self._best = self._better([p for p, s in self.levels.values()])
+        return self._best
+
+@njit(cache=True)
+def decide_fills(quote_bid, quote_ask, bid, ask, position_limit, risk_aversion):
+    """Fill side per step (+1 buy, -1 sell, 0 none) and fill prices
+    
+    Only this part is sequential: the inventory penalty and the position
+    limit both depend on the fills before each step. Quotes, positions,
+    cash and P&L are vectorized around it.
+    """
+    n = quote_bid.shape[0]
+    side = np.zeros(n, np.int8)
+    price = np.zeros(n, np.float64)
+    position = 0
+    
+    for idx in range(n):
+        # Calculate inventory penalty (Avellaneda-Stoikov style)
+        inventory_penalty = position * risk_aversion * 0.0001  # simplified
+        
+        # Calculate our quotes
+        our_bid = quote_bid[idx] - inventory_penalty
+        our_ask = quote_ask[idx] - inventory_penalty
+        
+        # Check if we can trade (simplified - assume we get filled if we're competitive)
+        # If market crosses our bid (someone hits our bid), we sell
+        if ask[idx] <= our_bid and position > -position_limit:
+            side[idx] = -1
+            price[idx] = our_bid
+            position -= TRADE_SIZE
+        # If market crosses our ask (someone lifts our ask), we buy
+        elif bid[idx] >= our_ask and position < position_limit:
+            side[idx] = 1
+            price[idx] = our_ask
+            position += TRADE_SIZE
+    
+    return side, price
+
 print("=" * 80)
 print("  HFT SYSTEM BACKTEST - PROFIT ANALYSIS")
 print("=" * 80)
@@ -13,7 +109,7 @@ print()
 
 # Load the synthetic tick data
 print("Loading synthetic_ticks.csv...")
-ticks = pd.read_csv('synthetic_ticks.csv')
+ticks = pd.read_csv('synthetic_ticks.csv', engine=CSV_ENGINE)
 print(f" Loaded {len(ticks):,} ticks\n")
 
 # Show data info
@@ -30,62 +126,53 @@ bid_prices = []
 ask_prices = []
 bid_sizes = []
 ask_sizes = []
-spreads = []
 timestamps = []
 
-current_bids = {}  # level -> (price, size)
-current_asks = {}  # level -> (price, size)
+current_bids = BookSide(max)
+current_asks = BookSide(min)
 
-for idx, row in ticks.iterrows():
-    if pd.isna(row['side']):
-        continue
-        
-    level = int(row['level']) if not pd.isna(row['level']) else 0
-    price = row['price']
-    size = row['size']
-    side = row['side']
-    event = row['event_type']
+# Snapshot rows (no side) never touch the book; drop them up front and walk
+# plain tuples. idx stays the original row label for the snapshot cadence.
+book_events = ticks.dropna(subset=['side'])[['ts_us', 'event_type', 'side', 'price', 'size', 'level']]
+
+for idx, ts, event, side, price, size, level in book_events.itertuples(index=True, name=None):
+    level = int(level) if level == level else 0  # NaN level -> 0
     
     # Update order book
-    if side == 'B':
-        if event == 'add' or event == 'modify':
-            current_bids[level] = (price, size)
-        elif event == 'cancel':
-            if level in current_bids:
-                del current_bids[level]
-    else:  # 'S'
-        if event == 'add' or event == 'modify':
-            current_asks[level] = (price, size)
-        elif event == 'cancel':
-            if level in current_asks:
-                del current_asks[level]
+    book = current_bids if side == 'B' else current_asks
+    if event == 'add' or event == 'modify':
+        book.update(level, price, size)
+    elif event == 'cancel':
+        book.cancel(level)
     
     # Take snapshot every 100 events
     if idx % 100 == 0 and current_bids and current_asks:
-        best_bid = max([p for p, s in current_bids.values()])
-        best_ask = min([p for p, s in current_asks.values()])
-        bid_size = sum([s for p, s in current_bids.values()])
-        ask_size = sum([s for p, s in current_asks.values()])
+        best_bid = current_bids.best
+        best_ask = current_asks.best
+        bid_size = current_bids.total_size
+        ask_size = current_asks.total_size
         
         bid_prices.append(best_bid)
         ask_prices.append(best_ask)
         bid_sizes.append(bid_size)
         ask_sizes.append(ask_size)
-        spreads.append(best_ask - best_bid)
-        timestamps.append(row['ts_us'])
+        timestamps.append(ts)
 
 print(f" Built {len(bid_prices)} order book snapshots\n")
 
-# Create market data DataFrame
-market_data = pd.DataFrame({
-    'timestamp': timestamps,
-    'bid': bid_prices,
-    'ask': ask_prices,
-    'mid': [(b + a) / 2 for b, a in zip(bid_prices, ask_prices)],
-    'spread': spreads,
-    'bid_size': bid_sizes,
-    'ask_size': ask_sizes
-})
+# Market data snapshots as plain column arrays; mid and spread are
+# derived from the best prices in one pass each
+bid_arr = np.asarray(bid_prices, dtype=np.float64)
+ask_arr = np.asarray(ask_prices, dtype=np.float64)
+market_data = {
+    'timestamp': np.asarray(timestamps, dtype=np.int64),
+    'bid': bid_arr,
+    'ask': ask_arr,
+    'mid': (bid_arr + ask_arr) * 0.5,
+    'spread': ask_arr - bid_arr,
+    'bid_size': np.asarray(bid_sizes, dtype=np.int64),
+    'ask_size': np.asarray(ask_sizes, dtype=np.int64)
+}
 
 print("=" * 80)
 print("  MARKET MAKING SIMULATION")
@@ -97,116 +184,83 @@ POSITION_LIMIT = 100
 RISK_AVERSION = 0.01
 initial_cash = 100000.0
 
-# State
-position = 0
-cash = initial_cash
-trades = []
-pnl_history = []
-
 print("Running market making strategy...")
 print()
 
-for idx in range(1, len(market_data)):
-    row = market_data.iloc[idx]
-    prev_row = market_data.iloc[idx - 1]
-    
-    mid = row['mid']
-    spread = row['spread']
-    
-    # Calculate inventory penalty (Avellaneda-Stoikov style)
-    inventory_penalty = position * RISK_AVERSION * 0.0001  # simplified
-    
-    # Calculate our quotes
-    our_bid = mid - spread/2 - inventory_penalty
-    our_ask = mid + spread/2 - inventory_penalty
-    
-    # Check if we can trade (simplified - assume we get filled if we're competitive)
-    market_bid = row['bid']
-    market_ask = row['ask']
-    
-    # If market crosses our bid (someone hits our bid), we sell
-    if market_ask <= our_bid and position > -POSITION_LIMIT:
-        trade_price = our_bid
-        position -= 10  # Sell 10 shares
-        cash += trade_price * 10
-        trades.append({
-            'time': row['timestamp'],
-            'side': 'SELL',
-            'price': trade_price,
-            'size': 10,
-            'position': position
-        })
-    
-    # If market crosses our ask (someone lifts our ask), we buy
-    elif market_bid >= our_ask and position < POSITION_LIMIT:
-        trade_price = our_ask
-        position += 10  # Buy 10 shares
-        cash -= trade_price * 10
-        trades.append({
-            'time': row['timestamp'],
-            'side': 'BUY',
-            'price': trade_price,
-            'size': 10,
-            'position': position
-        })
-    
-    # Calculate unrealized P&L
-    unrealized_pnl = position * mid
-    total_pnl = (cash - initial_cash) + unrealized_pnl
-    pnl_history.append(total_pnl)
+# Strategy steps on every snapshot after the first
+mid = market_data['mid'][1:]
+half_spread = market_data['spread'][1:] / 2
+fill_side, fill_price = decide_fills(
+    mid - half_spread, mid + half_spread,
+    market_data['bid'][1:],
+    market_data['ask'][1:],
+    POSITION_LIMIT, RISK_AVERSION)
+
+# Position and cash paths from the fills; cash starts from initial_cash
+# so the running sum rounds exactly like the step-by-step update
+position_path = np.cumsum(fill_side * TRADE_SIZE, dtype=np.int64)
+cash_path = np.cumsum(np.concatenate(([initial_cash], -(fill_side * fill_price * TRADE_SIZE))))[1:]
+pnl_history = (cash_path - initial_cash) + position_path * mid
+position = int(position_path[-1]) if position_path.size else 0
+cash = cash_path[-1] if cash_path.size else initial_cash
 
 print(f" Simulation complete\n")
 
 # Calculate results
-trades_df = pd.DataFrame(trades) if trades else pd.DataFrame()
-final_pnl = pnl_history[-1] if pnl_history else 0
-total_trades = len(trades)
+final_pnl = pnl_history[-1] if pnl_history.size else 0
+total_trades = np.count_nonzero(fill_side)
 
-print("=" * 80)
-print("  RESULTS")
-print("=" * 80)
-print()
+# Results are formatted into one buffer and written to stdout at the end
+report = StringIO()
+say = partial(print, file=report)
 
-print(f"💼 Trading Statistics:")
-print(f"   Total Trades:           {total_trades:,}")
-print(f"   Final Position:         {position}")
-print(f"   Final Cash:             ${cash:,.2f}")
-print()
+say("=" * 80)
+say("  RESULTS")
+say("=" * 80)
+say()
 
-print(f"Profit & Loss:")
-print(f"   Initial Capital:        ${initial_cash:,.2f}")
-print(f"   Final Cash + Position:  ${cash + (position * market_data.iloc[-1]['mid']):,.2f}")
-print(f"   Total P&L:              ${final_pnl:,.2f}")
-print(f"   Return:                 {(final_pnl / initial_cash * 100):.2f}%")
-print()
+say(f"💼 Trading Statistics:")
+say(f"   Total Trades:           {total_trades:,}")
+say(f"   Final Position:         {position}")
+say(f"   Final Cash:             ${cash:,.2f}")
+say()
+
+say(f"Profit & Loss:")
+say(f"   Initial Capital:        ${initial_cash:,.2f}")
+say(f"   Final Cash + Position:  ${cash + (position * market_data['mid'][-1]):,.2f}")
+say(f"   Total P&L:              ${final_pnl:,.2f}")
+say(f"   Return:                 {(final_pnl / initial_cash * 100):.2f}%")
+say()
 
 if total_trades > 0:
     duration_seconds = (timestamps[-1] - timestamps[0]) / 1e6
     trades_per_second = total_trades / duration_seconds
     pnl_per_trade = final_pnl / total_trades
     
-    print(f"Performance:")
-    print(f"   Duration:               {duration_seconds:.2f} seconds")
-    print(f"   Trades/Second:          {trades_per_second:.2f}")
-    print(f"   P&L per Trade:          ${pnl_per_trade:.4f}")
-    print()
+    say(f"Performance:")
+    say(f"   Duration:               {duration_seconds:.2f} seconds")
+    say(f"   Trades/Second:          {trades_per_second:.2f}")
+    say(f"   P&L per Trade:          ${pnl_per_trade:.4f}")
+    say()
     
     # Extrapolate to full day
     seconds_per_day = 6.5 * 3600  # Trading hours
     daily_pnl = (final_pnl / duration_seconds) * seconds_per_day
     
-    print(f"Projections:")
-    print(f"   Daily P&L (projected):  ${daily_pnl:,.2f}")
-    print(f"   Monthly (21 days):      ${daily_pnl * 21:,.2f}")
-    print(f"   Annual (252 days):      ${daily_pnl * 252:,.2f}")
-    print()
-
-print(f"Market Statistics:")
-print(f"   Avg Mid Price:          ${market_data['mid'].mean():.2f}")
-print(f"   Avg Spread:             ${market_data['spread'].mean():.4f}")
-print(f"   Spread (bps):           {(market_data['spread'].mean() / market_data['mid'].mean() * 10000):.2f} bps")
-print()
+    say(f"Projections:")
+    say(f"   Daily P&L (projected):  ${daily_pnl:,.2f}")
+    say(f"   Monthly (21 days):      ${daily_pnl * 21:,.2f}")
+    say(f"   Annual (252 days):      ${daily_pnl * 252:,.2f}")
+    say()
 
-print("=" * 80)
-print(" Backtest Complete!")
-print("=" * 80)
+say(f"Market Statistics:")
+say(f"   Avg Mid Price:          ${market_data['mid'].mean():.2f}")
+say(f"   Avg Spread:             ${market_data['spread'].mean():.4f}")
+say(f"   Spread (bps):           {(market_data['spread'].mean() / market_data['mid'].mean() * 10000):.2f} bps")
+say()
+
+say("=" * 80)
+say(" Backtest Complete!")
+say("=" * 80)
+
+sys.stdout.write(report.getvalue())
@@ -4,9 +4,29 @@ Data Verification Script
 Analyzes synthetic_ticks_with_alpha.csv to verify quality and alpha patterns
 """
 
-import csv
+import sys
 import numpy as np
-from collections import defaultdict
+import pandas as pd
+from functools import partial
+from io import StringIO
+
+try:
+    import pyarrow  # only probed; pandas drives the reader
+    CSV_ENGINE = 'pyarrow'  # multithreaded Arrow CSV reader
+except ImportError:  # pyarrow is optional; pandas' C parser reads the same file
+    CSV_ENGINE = 'c'
+
+# Tick CSV layout (no header row), one typed column per field
+TICK_COLUMNS = ['timestamp', 'event_type', 'side', 'price', 'size', 'order_id', 'depth']
+TICK_DTYPES = {
+    'timestamp': 'int64',
+    'event_type': 'object',
+    'side': 'object',
+    'price': 'float64',
+    'size': 'int32',
+    'order_id': 'int64',
+    'depth': 'int16'
+}
 
 print("=" * 70)
 print("  SYNTHETIC DATA VERIFICATION REPORT")
@@ -17,194 +37,184 @@ print()
 filename = "synthetic_ticks_with_alpha.csv"
 print(f"📂 Loading: {filename}")
 
-events = []
-with open(filename, 'r') as f:
-    for line in f:
-        parts = line.strip().split(',')
-        if len(parts) >= 7:
-            events.append({
-                'timestamp': int(parts[0]),
-                'event_type': parts[1],
-                'side': parts[2],
-                'price': float(parts[3]),
-                'size': int(parts[4]),
-                'order_id': int(parts[5]),
-                'depth': int(parts[6])
-            })
-
-print(f"Loaded {len(events):,} events")
+# memory_map is a C-parser option; Arrow does its own buffered reads
+reader_options = {'memory_map': True} if CSV_ENGINE == 'c' else {}
+ticks = pd.read_csv(filename, header=None, names=TICK_COLUMNS, dtype=TICK_DTYPES,
+                    engine=CSV_ENGINE, **reader_options)
+timestamps = ticks['timestamp'].to_numpy()
+event_col = ticks['event_type'].to_numpy()
+side_col = ticks['side'].to_numpy()
+prices = ticks['price'].to_numpy()
+sizes = ticks['size'].to_numpy()
+n_events = len(ticks)
+
+# Side and event masks, compared once and shared by every analysis below
+is_add = event_col == 'add'
+is_buy = side_col == 'B'
+is_sell = side_col == 'S'
+n_buy = np.count_nonzero(is_buy)
+n_sell = np.count_nonzero(is_sell)
+
+print(f"Loaded {n_events:,} events")
 print()
 
+# The report is formatted into one buffer and written to stdout at the end
+report = StringIO()
+say = partial(print, file=report)
+
 # Basic statistics
-print("BASIC STATISTICS")
-print("-" * 70)
+say("BASIC STATISTICS")
+say("-" * 70)
 
-timestamps = [e['timestamp'] for e in events]
 duration_ns = timestamps[-1] - timestamps[0]
 duration_sec = duration_ns / 1e9
 
-print(f"Duration:        {duration_sec:.3f} seconds ({duration_ns:,} ns)")
-print(f"Events:          {len(events):,}")
-print(f"Event rate:      {len(events)/duration_sec:,.0f} events/sec")
-print(f"Avg tick gap:    {duration_ns/len(events):.0f} ns")
-print()
+say(f"Duration:        {duration_sec:.3f} seconds ({duration_ns:,} ns)")
+say(f"Events:          {n_events:,}")
+say(f"Event rate:      {n_events/duration_sec:,.0f} events/sec")
+say(f"Avg tick gap:    {duration_ns/n_events:.0f} ns")
+say()
 
 # Price analysis
-prices = [e['price'] for e in events]
-print("💵 PRICE ANALYSIS")
-print("-" * 70)
-print(f"Min price:       ${min(prices):.4f}")
-print(f"Max price:       ${max(prices):.4f}")
-print(f"Mean price:      ${np.mean(prices):.4f}")
-print(f"Std dev:         ${np.std(prices):.4f}")
-print(f"Price range:     ${max(prices) - min(prices):.4f}")
-print()
+say("💵 PRICE ANALYSIS")
+say("-" * 70)
+say(f"Min price:       ${prices.min():.4f}")
+say(f"Max price:       ${prices.max():.4f}")
+say(f"Mean price:      ${np.mean(prices):.4f}")
+say(f"Std dev:         ${np.std(prices):.4f}")
+say(f"Price range:     ${prices.max() - prices.min():.4f}")
+say()
 
 # Order flow imbalance detection
-print("ALPHA BURST DETECTION")
-print("-" * 70)
+say("ALPHA BURST DETECTION")
+say("-" * 70)
 
-# Calculate OBI over windows
+# Calculate OBI over windows starting at 0 .. n_events - window_size - 1.
+# Window counts are differences of running add counts (prefixed with 0).
 window_size = 15  # Match burst duration
-obi_values = []
+buy_adds = np.concatenate(([0], np.cumsum(is_add & is_buy)))
+sell_adds = np.concatenate(([0], np.cumsum(is_add & is_sell)))
+n_windows = max(n_events - window_size, 0)
+buy_count = buy_adds[window_size:window_size + n_windows] - buy_adds[:n_windows]
+sell_count = sell_adds[window_size:window_size + n_windows] - sell_adds[:n_windows]
 
-for i in range(len(events) - window_size):
-    window = events[i:i+window_size]
-    
-    buy_count = sum(1 for e in window if e['side'] == 'B' and e['event_type'] == 'add')
-    sell_count = sum(1 for e in window if e['side'] == 'S' and e['event_type'] == 'add')
-    
-    total = buy_count + sell_count
-    if total > 0:
-        obi = (buy_count - sell_count) / total
-        obi_values.append({
-            'index': i,
-            'timestamp': events[i]['timestamp'],
-            'obi': obi,
-            'strength': abs(obi)
-        })
+total = buy_count + sell_count
+obi_index = np.flatnonzero(total > 0)
+obi = (buy_count[obi_index] - sell_count[obi_index]) / total[obi_index]
+strength = np.abs(obi)
 
 # Find strong OBI bursts (> 0.6 strength)
-strong_bursts = [o for o in obi_values if o['strength'] > 0.6]
-
-print(f"Total {window_size}-tick windows analyzed: {len(obi_values):,}")
-print(f"Strong OBI bursts detected (>60%):      {len(strong_bursts):,}")
-print()
-
-if strong_bursts:
-    # Group consecutive bursts
-    burst_groups = []
-    current_group = [strong_bursts[0]]
-    
-    for i in range(1, len(strong_bursts)):
-        # If consecutive or within 100 ticks
-        if strong_bursts[i]['index'] - strong_bursts[i-1]['index'] < 100:
-            current_group.append(strong_bursts[i])
-        else:
-            if len(current_group) >= 5:  # Significant burst
-                burst_groups.append(current_group)
-            current_group = [strong_bursts[i]]
+strong = strength > 0.6
+burst_index = obi_index[strong]
+
+say(f"Total {window_size}-tick windows analyzed: {obi_index.size:,}")
+say(f"Strong OBI bursts detected (>60%):      {burst_index.size:,}")
+say()
+
+# Group consecutive bursts: a new group starts wherever the gap to the
+# previous strong window is 100 ticks or more
+group_starts = np.flatnonzero(np.diff(burst_index, prepend=-100) >= 100)
+group_len = np.diff(group_starts, append=burst_index.size)
+significant = group_len >= 5  # Significant burst
+
+group_obi = np.add.reduceat(obi[strong], group_starts)[significant] / group_len[significant]
+group_strength = np.add.reduceat(strength[strong], group_starts)[significant] / group_len[significant]
+group_start_event = burst_index[group_starts[significant]]
+group_len = group_len[significant]
+n_groups = group_len.size
+
+if burst_index.size:
+    say(f"Persistent alpha bursts identified:     {n_groups}")
+    say()
     
-    if len(current_group) >= 5:
-        burst_groups.append(current_group)
+    say("Top 10 strongest bursts:")
+    say(f"  {'Event':<10} {'OBI':<10} {'Strength':<10} {'Duration'}")
+    say("  " + "-" * 60)
     
-    print(f"Persistent alpha bursts identified:     {len(burst_groups)}")
-    print()
-    
-    print("Top 10 strongest bursts:")
-    print(f"  {'Event':<10} {'OBI':<10} {'Strength':<10} {'Duration'}")
-    print("  " + "-" * 60)
-    
-    # Sort by average strength
-    sorted_groups = sorted(burst_groups, key=lambda grp: np.mean([b['strength'] for b in grp]), reverse=True)
-    for group in sorted_groups[:10]:
-        avg_obi = np.mean([b['obi'] for b in group])
-        avg_strength = np.mean([b['strength'] for b in group])
-        duration_ticks = len(group)
-        start_event = group[0]['index']
-        
+    # Sort by average strength (stable, strongest first)
+    for g in np.argsort(-group_strength, kind='stable')[:10]:
+        avg_obi = group_obi[g]
         direction = "BUY" if avg_obi > 0 else "SELL"
-        print(f"  {start_event:<10,} {avg_obi:>+8.2%} {avg_strength:>8.2%}  {duration_ticks:>3} ticks ({direction})")
+        say(f"  {group_start_event[g]:<10,} {avg_obi:>+8.2%} {group_strength[g]:>8.2%}  {group_len[g]:>3} ticks ({direction})")
 
-print()
+say()
 
 # Event type distribution
-print("📋 EVENT TYPE DISTRIBUTION")
-print("-" * 70)
+say("📋 EVENT TYPE DISTRIBUTION")
+say("-" * 70)
 
-event_types = defaultdict(int)
-for e in events:
-    event_types[e['event_type']] += 1
+event_types, event_counts = np.unique(event_col, return_counts=True)
+order = np.argsort(-event_counts, kind='stable')  # most frequent first
 
-for event_type, count in sorted(event_types.items(), key=lambda x: x[1], reverse=True):
-    pct = count * 100.0 / len(events)
-    print(f"  {event_type:<12} {count:>8,} ({pct:>5.1f}%)")
+for event_type, count in zip(event_types[order], event_counts[order]):
+    pct = count * 100.0 / n_events
+    say(f"  {event_type:<12} {count:>8,} ({pct:>5.1f}%)")
 
-print()
+say()
 
 # Side distribution
-print("SIDE DISTRIBUTION")
-print("-" * 70)
+say("SIDE DISTRIBUTION")
+say("-" * 70)
 
-sides = defaultdict(int)
-for e in events:
-    sides[e['side']] += 1
+sides, side_counts = np.unique(side_col, return_counts=True)
+order = np.argsort(-side_counts, kind='stable')
 
-for side, count in sorted(sides.items(), key=lambda x: x[1], reverse=True):
-    pct = count * 100.0 / len(events)
+for side, count in zip(sides[order], side_counts[order]):
+    pct = count * 100.0 / n_events
     side_name = "Buy" if side == 'B' else "Sell"
-    print(f"  {side_name:<12} {count:>8,} ({pct:>5.1f}%)")
+    say(f"  {side_name:<12} {count:>8,} ({pct:>5.1f}%)")
 
-print()
+say()
 
 # Size distribution
-print("📦 ORDER SIZE DISTRIBUTION")
-print("-" * 70)
+say("📦 ORDER SIZE DISTRIBUTION")
+say("-" * 70)
 
-sizes = [e['size'] for e in events]
-print(f"  Min:         {min(sizes):,}")
-print(f"  Max:         {max(sizes):,}")
-print(f"  Mean:        {np.mean(sizes):.1f}")
-print(f"  Median:      {np.median(sizes):.0f}")
-print(f"  Std dev:     {np.std(sizes):.1f}")
+say(f"  Min:         {sizes.min():,}")
+say(f"  Max:         {sizes.max():,}")
+say(f"  Mean:        {np.mean(sizes):.1f}")
+say(f"  Median:      {np.median(sizes):.0f}")
+say(f"  Std dev:     {np.std(sizes):.1f}")
 
-print()
+say()
 
 # Verification summary
-print("=" * 70)
-print("  VERIFICATION SUMMARY")
-print("=" * 70)
-print()
+say("=" * 70)
+say("  VERIFICATION SUMMARY")
+say("=" * 70)
+say()
 
 checks = [
-    ("PASS" if len(events) >= 90000 else "FAIL", f"Sufficient events: {len(events):,} >= 90,000"),
+    ("PASS" if n_events >= 90000 else "FAIL", f"Sufficient events: {n_events:,} >= 90,000"),
     ("PASS" if duration_sec >= 0.005 else "FAIL", f"Sufficient duration: {duration_sec:.3f}s >= 0.005s"),
-    ("PASS" if len(burst_groups) >= 10 else "WARN", f"Alpha bursts detected: {len(burst_groups)} (expected ~17)"),
-    ("PASS" if abs(sides['B'] - sides['S']) / len(events) < 0.05 else "FAIL", "Side balance within 5%"),
+    ("PASS" if n_groups >= 10 else "WARN", f"Alpha bursts detected: {n_groups} (expected ~17)"),
+    ("PASS" if abs(n_buy - n_sell) / n_events < 0.05 else "FAIL", "Side balance within 5%"),
     ("PASS" if np.std(prices) < 0.2 else "FAIL", f"Price volatility reasonable: σ={np.std(prices):.4f}"),
 ]
 
 for symbol, check in checks:
-    print(f"{symbol} {check}")
+    say(f"{symbol} {check}")
 
-print()
+say()
 
 # Temporal filter compatibility
-print("🔍 TEMPORAL FILTER COMPATIBILITY CHECK")
-print("-" * 70)
-print(f"Filter requirement: 12 consecutive ticks with same OBI direction")
-print(f"Data provides:      15-tick bursts with 85% directional bias")
-print()
+say("🔍 TEMPORAL FILTER COMPATIBILITY CHECK")
+say("-" * 70)
+say(f"Filter requirement: 12 consecutive ticks with same OBI direction")
+say(f"Data provides:      15-tick bursts with 85% directional bias")
+say()
 
-compatible_bursts = sum(1 for g in burst_groups if len(g) >= 12)
-print(f"Bursts ≥12 ticks:   {compatible_bursts}/{len(burst_groups)}")
+compatible_bursts = np.count_nonzero(group_len >= 12)
+say(f"Bursts ≥12 ticks:   {compatible_bursts}/{n_groups}")
 
 if compatible_bursts >= 10:
-    print("Data is compatible with 12-tick temporal filter")
+    say("Data is compatible with 12-tick temporal filter")
 else:
-    print("Warning: May need to adjust filter parameters or regenerate data")
+    say("Warning: May need to adjust filter parameters or regenerate data")
 
-print()
-print("=" * 70)
-print("  DATA VERIFICATION COMPLETE")
-print("=" * 70)
+say()
+say("=" * 70)
+say("  DATA VERIFICATION COMPLETE")
+say("=" * 70)
+
+sys.stdout.write(report.getvalue())
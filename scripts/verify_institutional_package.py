@@ -8,6 +8,8 @@ import os
 import json
 import hashlib
 
+HASH_BLOCK_SIZE = 1 << 20  # checksum read size when hashlib.file_digest is unavailable
+
 def check_file_exists(filepath, description):
     """Check if file exists and return status"""
     exists = os.path.exists(filepath)
@@ -36,6 +38,11 @@ market_data_ok = check_file_exists("synthetic_ticks_with_alpha.csv", "Market dat
 metadata_ok = check_file_exists("market_data_metadata.json", "Market data metadata (JSON)")
 print()
 
+# Metadata is read once and shared by the checksum and key-metrics sections
+if metadata_ok:
+    with open('market_data_metadata.json', 'r') as f:
+        metadata = json.load(f)
+
 # Check verification logs
 print("📄 VERIFICATION LOGS:")
 print("-" * 80)
@@ -65,15 +72,19 @@ print("DATA INTEGRITY:")
 print("-" * 80)
 if market_data_ok and metadata_ok:
     # Calculate SHA256
-    sha256_hash = hashlib.sha256()
     with open("synthetic_ticks_with_alpha.csv", 'rb') as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    calculated_checksum = sha256_hash.hexdigest()
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            calculated_checksum = hashlib.file_digest(f, 'sha256').hexdigest()
+        else:
+            # 1 MiB blocks read into one reused buffer
+            sha256_hash = hashlib.sha256()
+            buf = bytearray(HASH_BLOCK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                sha256_hash.update(view[:n])
+            calculated_checksum = sha256_hash.hexdigest()
     
     # Load expected checksum
-    with open('market_data_metadata.json', 'r') as f:
-        metadata = json.load(f)
     expected_checksum = metadata['sha256']
     
     if calculated_checksum == expected_checksum:
@@ -115,9 +126,6 @@ print("=" * 80)
 
 # List key metrics
 if metadata_ok:
-    with open('market_data_metadata.json', 'r') as f:
-        metadata = json.load(f)
-    
     print()
     print("KEY METRICS:")
     print("-" * 80)
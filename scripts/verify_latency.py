@@ -10,76 +10,203 @@ It does NOT trust inline latency claims.
 """
 
 import re
-from typing import Dict, List, Tuple
+import numpy as np
+
+# Log line patterns, compiled once. Logs are read as bytes; every pattern is
+# anchored on a leading keyword, so '#' comments and blank lines never match.
+_NIC_RE = re.compile(rb'(RX|TX)_PKT seq=(\d+) .*ts_hw_ns=(\d+)')
+_STRATEGY_RX_RE = re.compile(rb'EVENT RX seq=(\d+) tsc=(\d+)')
+_STRATEGY_DECISION_RE = re.compile(rb'EVENT DECISION side=(\w+) tsc=(\d+)')
+_STRATEGY_SEND_RE = re.compile(rb'EVENT SEND seq=(\d+) tsc=(\d+)')
+_EXCHANGE_ACK_RE = re.compile(rb'ACK order_id=(\d+) exch_ts_ns=(\d+)')
+
+class SeqTable:
+    """Timestamps keyed by sequence number (a seq -> timestamp dict as arrays)
+    
+    Sequence numbers are normally dense within a log, so the timestamps sit
+    in one int64 array offset by the lowest seq, -1 where a seq is absent.
+    Sparse keys (e.g. exchange-assigned order ids) would make that array
+    huge, so past a density limit the table keeps sorted seqs and
+    timestamps instead and looks them up with searchsorted.
+    """
+    
+    def __init__(self, seqs, timestamps):
+        seqs = np.asarray(seqs, dtype=np.int64)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.base = int(seqs.min()) if seqs.size else 0
+        span = int(seqs.max()) - self.base + 1 if seqs.size else 0
+        if span <= 4 * seqs.size + 1024:
+            self.keys = None  # dense: ts[seq - base]
+            self.ts = np.full(span, -1, dtype=np.int64)
+            self.ts[seqs - self.base] = timestamps
+        else:
+            # Sparse: sorted unique seqs, the last entry per seq wins as in a dict
+            order = np.argsort(seqs, kind='stable')
+            seqs, timestamps = seqs[order], timestamps[order]
+            last = np.append(seqs[1:] != seqs[:-1], True)
+            self.keys = seqs[last]
+            self.ts = timestamps[last]
+    
+    def first_seq(self) -> int:
+        """Lowest seq loaded, whatever the log order (as min() over dict keys)"""
+        if not self.ts.size:
+            raise ValueError("no sequence numbers loaded")
+        return self.base
+    
+    def _locate(self, seqs):
+        """Array positions of seqs and whether each seq is present"""
+        seqs = np.asarray(seqs, dtype=np.int64)
+        if self.keys is None:
+            i = seqs - self.base
+            inside = (i >= 0) & (i < self.ts.size)
+            i = np.where(inside, i, 0)
+            return i, inside & (self.ts[i] >= 0) if self.ts.size else inside
+        i = np.minimum(np.searchsorted(self.keys, seqs), self.keys.size - 1)
+        return i, self.keys[i] == seqs
+    
+    def __contains__(self, seq: int) -> bool:
+        return bool(self._locate(seq)[1])
+    
+    def __getitem__(self, seq: int) -> int:
+        i, found = self._locate(seq)
+        if not found:
+            raise KeyError(seq)
+        return int(self.ts[i])
+    
+    def seqs(self) -> np.ndarray:
+        """Sequence numbers present, ascending"""
+        if self.keys is None:
+            return np.flatnonzero(self.ts >= 0) + self.base
+        return self.keys
+    
+    def take(self, seqs) -> np.ndarray:
+        """Timestamps for an array of seqs, -1 where absent"""
+        i, found = self._locate(seqs)
+        return np.where(found, self.ts[i], -1) if self.ts.size else np.full(found.shape, -1, dtype=np.int64)
 
 class TimestampCorrelator:
     def __init__(self):
-        self.nic_rx: Dict[int, int] = {}  # seq -> hw_timestamp
-        self.nic_tx: Dict[int, int] = {}  # seq -> hw_timestamp
-        self.strategy_rx: Dict[int, int] = {}  # seq -> tsc
-        self.strategy_decision: List[Tuple[str, int]] = []  # (side, tsc)
-        self.strategy_send: Dict[int, int] = {}  # seq -> tsc
-        self.exchange_ack: Dict[int, int] = {}  # order_id -> exch_ts
+        self.nic_rx = SeqTable([], [])  # seq -> hw_timestamp
+        self.nic_tx = SeqTable([], [])  # seq -> hw_timestamp
+        self.strategy_rx = SeqTable([], [])  # seq -> tsc
+        self.decision_side = np.empty(0, dtype=str)  # side per DECISION event
+        self.decision_tsc = np.empty(0, dtype=np.int64)  # tsc per DECISION event
+        self.strategy_send = SeqTable([], [])  # seq -> tsc
+        self.exchange_ack = SeqTable([], [])  # order_id -> exch_ts
         
         # TSC to nanosecond conversion (calibrated from PTP)
         self.tsc_freq_ghz = 2.7  # CPU frequency
         
     def load_nic_log(self, filename: str):
         """Parse NIC hardware timestamps"""
-        with open(filename) as f:
+        rx_seqs, rx_ts, tx_seqs, tx_ts = [], [], [], []
+        match = _NIC_RE.match
+        with open(filename, 'rb') as f:
             for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                match = re.match(r'(RX|TX)_PKT seq=(\d+) .*ts_hw_ns=(\d+)', line)
-                if match:
-                    direction, seq, ts = match.groups()
-                    if direction == 'RX':
-                        self.nic_rx[int(seq)] = int(ts)
+                m = match(line)
+                if m:
+                    direction, seq, ts = m.groups()
+                    if direction == b'RX':
+                        rx_seqs.append(int(seq))
+                        rx_ts.append(int(ts))
                     else:
-                        self.nic_tx[int(seq)] = int(ts)
+                        tx_seqs.append(int(seq))
+                        tx_ts.append(int(ts))
+        self.nic_rx = SeqTable(rx_seqs, rx_ts)
+        self.nic_tx = SeqTable(tx_seqs, tx_ts)
     
     def load_strategy_log(self, filename: str):
         """Parse user-space strategy trace (TSC values)"""
-        with open(filename) as f:
+        rx_seqs, rx_tsc, send_seqs, send_tsc = [], [], [], []
+        decision_side, decision_tsc = [], []
+        match_rx = _STRATEGY_RX_RE.match
+        match_decision = _STRATEGY_DECISION_RE.match
+        match_send = _STRATEGY_SEND_RE.match
+        with open(filename, 'rb') as f:
             for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                    
                 # RX events
-                match = re.match(r'EVENT RX seq=(\d+) tsc=(\d+)', line)
-                if match:
-                    seq, tsc = match.groups()
-                    self.strategy_rx[int(seq)] = int(tsc)
+                m = match_rx(line)
+                if m:
+                    seq, tsc = m.groups()
+                    rx_seqs.append(int(seq))
+                    rx_tsc.append(int(tsc))
                     continue
                 
                 # DECISION events
-                match = re.match(r'EVENT DECISION side=(\w+) tsc=(\d+)', line)
-                if match:
-                    side, tsc = match.groups()
-                    self.strategy_decision.append((side, int(tsc)))
+                m = match_decision(line)
+                if m:
+                    side, tsc = m.groups()
+                    decision_side.append(side.decode())
+                    decision_tsc.append(int(tsc))
                     continue
                 
                 # SEND events
-                match = re.match(r'EVENT SEND seq=(\d+) tsc=(\d+)', line)
-                if match:
-                    seq, tsc = match.groups()
-                    self.strategy_send[int(seq)] = int(tsc)
+                m = match_send(line)
+                if m:
+                    seq, tsc = m.groups()
+                    send_seqs.append(int(seq))
+                    send_tsc.append(int(tsc))
+        self.strategy_rx = SeqTable(rx_seqs, rx_tsc)
+        self.strategy_send = SeqTable(send_seqs, send_tsc)
+        self.decision_side = np.array(decision_side, dtype=str)
+        self.decision_tsc = np.array(decision_tsc, dtype=np.int64)
     
     def load_exchange_log(self, filename: str):
         """Parse exchange ACKs (external timestamps)"""
-        with open(filename) as f:
+        order_ids, ack_ts = [], []
+        match = _EXCHANGE_ACK_RE.match
+        with open(filename, 'rb') as f:
             for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                match = re.match(r'ACK order_id=(\d+) exch_ts_ns=(\d+)', line)
-                if match:
-                    order_id, ts = match.groups()
-                    self.exchange_ack[int(order_id)] = int(ts)
+                m = match(line)
+                if m:
+                    order_id, ts = m.groups()
+                    order_ids.append(int(order_id))
+                    ack_ts.append(int(ts))
+        self.exchange_ack = SeqTable(order_ids, ack_ts)
     
-    def tsc_to_ns(self, tsc: int) -> int:
-        """Convert TSC to nanoseconds (approximate)"""
+    def tsc_to_ns(self, tsc):
+        """Convert TSC ticks (scalar or array) to nanoseconds (approximate)"""
         # This is simplified - real conversion uses PTP correlation
-        return int(tsc / self.tsc_freq_ghz)
+        ns = (np.asarray(tsc) / self.tsc_freq_ghz).astype(np.int64)  # truncates like int()
+        return int(ns) if ns.ndim == 0 else ns
+    
+    def latency_samples(self):
+        """Per-event latencies (ns) for every correlated event, as arrays
+        
+        Each DECISION pairs with the latest strategy RX at or before it, each
+        SEND with the latest DECISION at or before it, and each exchange ACK
+        with the NIC TX of the same seq (order_id). Returns path ->
+        (latencies, skipped): events with no partner, or a negative delta,
+        are left out and counted in skipped.
+        """
+        def latest_before(later_tsc, earlier_tsc):
+            earlier = np.sort(earlier_tsc)
+            prior = np.searchsorted(earlier, later_tsc, side='right') - 1
+            matched = prior >= 0
+            return later_tsc[matched] - earlier[prior[matched]], later_tsc.size - np.count_nonzero(matched)
+        
+        rx_tsc = self.strategy_rx.take(self.strategy_rx.seqs())
+        send_tsc = self.strategy_send.take(self.strategy_send.seqs())
+        rx_to_decision, rx_unmatched = latest_before(self.decision_tsc, rx_tsc)
+        decision_to_send, send_unmatched = latest_before(send_tsc, self.decision_tsc)
+        
+        order_ids = self.exchange_ack.seqs()
+        tx_ts = self.nic_tx.take(order_ids)
+        sent = tx_ts >= 0
+        wire_to_ack = self.exchange_ack.take(order_ids[sent]) - tx_ts[sent]
+        
+        samples = {}
+        for path, delta, unmatched in (
+                ("RX → DECISION", rx_to_decision, rx_unmatched),
+                ("DECISION → SEND", decision_to_send, send_unmatched),
+                ("WIRE → EXCHANGE_ACK", wire_to_ack, order_ids.size - wire_to_ack.size)):
+            negative = delta < 0
+            samples[path] = (delta[~negative], unmatched + np.count_nonzero(negative))
+        # Strategy deltas are TSC ticks; the wire path is already in ns
+        for path in ("RX → DECISION", "DECISION → SEND"):
+            tsc, skipped = samples[path]
+            samples[path] = (self.tsc_to_ns(tsc), skipped)
+        return samples
     
     def compute_latencies(self):
         """Compute actual latencies from correlated timestamps"""
@@ -87,15 +214,16 @@ class TimestampCorrelator:
         print("LATENCY CORRELATION ANALYSIS")
         print("="*70 + "\n")
         
-        # Example: Correlate first RX → DECISION → TX → EXCHANGE_ACK
-        first_rx_seq = min(self.nic_rx.keys())
-        first_tx_seq = min(self.nic_tx.keys())
+        # Example: Correlate first RX → DECISION → TX → EXCHANGE_ACK,
+        # starting from the lowest RX and TX seqs in the logs
+        first_rx_seq = self.nic_rx.first_seq()
+        first_tx_seq = self.nic_tx.first_seq()
         
         nic_rx_ts = self.nic_rx[first_rx_seq]
         strategy_rx_tsc = self.strategy_rx[first_rx_seq]
         
-        if len(self.strategy_decision) > 0:
-            decision_side, decision_tsc = self.strategy_decision[0]
+        if self.decision_tsc.size > 0:
+            decision_side, decision_tsc = self.decision_side[0], int(self.decision_tsc[0])
             
             # RX → DECISION latency (user-space)
             rx_to_decision_tsc = decision_tsc - strategy_rx_tsc
@@ -109,7 +237,7 @@ class TimestampCorrelator:
         
         if first_tx_seq in self.strategy_send:
             send_tsc = self.strategy_send[first_tx_seq]
-            decision_tsc = self.strategy_decision[0][1]
+            decision_tsc = int(self.decision_tsc[0])
             
             # DECISION → TX latency
             decision_to_tx_tsc = send_tsc - decision_tsc
@@ -143,6 +271,20 @@ class TimestampCorrelator:
             print(f"  {total_rtt_ns} ns ({total_rtt_ns/1000:.1f} µs)")
             print()
         
+        # Distributions over every correlated event
+        print(f"DISTRIBUTIONS (ns):")
+        print(f"  {'Path':<22} {'n':>4} {'p50':>8} {'p90':>8} {'p99':>8} {'p99.9':>8}")
+        skipped_paths = []
+        for path, (samples, skipped) in self.latency_samples().items():
+            if samples.size:
+                p50, p90, p99, p999 = np.percentile(samples, [50, 90, 99, 99.9])
+                print(f"  {path:<22} {samples.size:>4} {p50:>8.0f} {p90:>8.0f} {p99:>8.0f} {p999:>8.0f}")
+            if skipped:
+                skipped_paths.append(f"{path}: {skipped}")
+        if skipped_paths:
+            print(f"  Skipped (no partner event or negative delta): {', '.join(skipped_paths)}")
+        print()
+        
         print("="*70)
         print("NOTE: Latencies computed offline from raw timestamps")
         print("      TSC→ns conversion is approximate without PTP correlation")
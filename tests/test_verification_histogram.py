@@ -0,0 +1,39 @@
+"""Latency histogram binning in generate_institutional_verification.py must
+match np.histogram bin for bin, including samples that sit on bin edges,
+on both the NumPy path and the numba kernel (run as plain Python when numba
+is not installed)."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "scripts"))
+
+import generate_institutional_verification as verification  # noqa: E402
+
+BINS = 20
+
+
+def test_bin_counts_on_edges_match_np_histogram():
+    # Every integer in [0, hi] with hi a multiple of BINS, so every bin edge
+    # is itself a sample (980, 1960, 4980, ... round into the wrong bin
+    # without the edge correction)
+    for hi in range(BINS, 20001, BINS):
+        a = np.arange(hi + 1, dtype=np.int32)
+        edges = np.linspace(0, hi, BINS + 1)
+        expected, _ = np.histogram(a, BINS, (0, hi))
+        np.testing.assert_array_equal(verification._bin_counts(a, edges), expected, err_msg=f"hi={hi}")
+        np.testing.assert_array_equal(verification._hist_bars(a, edges, 50)[0], expected, err_msg=f"hi={hi}")
+
+
+@pytest.mark.parametrize("seed", [42, 188, 7, 2024])
+def test_bin_counts_on_latency_samples_match_np_histogram(seed):
+    rng = np.random.default_rng(seed)
+    for shape, scale in ((2.0, 250.0), (1.5, 180.0), (1.2, 50.0)):
+        a = np.rint(rng.standard_gamma(shape, 1000) * scale).astype(np.int32)
+        edges = np.linspace(a.min(), a.max(), BINS + 1)
+        expected, _ = np.histogram(a, BINS, (a.min(), a.max()))
+        np.testing.assert_array_equal(verification._bin_counts(a, edges), expected)
+        np.testing.assert_array_equal(verification._hist_bars(a, edges, 50)[0], expected)